@@ -3,15 +3,18 @@
 """
 import os
 import json
+from types import MappingProxyType
 
 # ==================== 네이버 계정 정보 ====================
 # 환경변수 NAVER_ACCOUNTS를 JSON 문자열로 받음 
 # 예: '{"id1":"pw1", "id2":"pw2"}'
 naver_accounts_env = os.getenv('NAVER_ACCOUNTS', '{}')
 try:
-    naver_login_info = json.loads(naver_accounts_env)
+    _naver_accounts = json.loads(naver_accounts_env)
 except json.JSONDecodeError:
-    naver_login_info = {}
+    _naver_accounts = {}
+# import 시 1회 로드 후 읽기 전용으로 고정
+naver_login_info = MappingProxyType(_naver_accounts if isinstance(_naver_accounts, dict) else {})
 
 # ==================== 기본 설정 ====================
 # Docker 내부 경로에 맞춰 기본값 설정
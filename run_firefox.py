@@ -15,11 +15,19 @@ import fcntl
 import config
 import random
 import atexit
+import queue
 import logging
+import logging.handlers
 import requests
+import functools
 from pathlib import Path
-from typing import Set, Dict
+from typing import Set, Dict, List, Tuple, Iterable
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
 from selenium import webdriver
 from selenium.common.exceptions import (
     NoAlertPresentException, 
@@ -31,7 +39,86 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from urllib.parse import urlparse, urljoin, parse_qs
+from urllib.parse import (
+    urlparse, urlunparse, urljoin, urlencode, parse_qs, parse_qsl, ParseResult
+)
+
+# JSON 직렬화 (orjson 미설치 시 표준 json 사용)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# URL 추출용 정규식 (모듈 로드 시 1회 컴파일)
+_ONCLICK_URL_RE = re.compile(r"['\"](https?://[^'\"]+)['\"]")
+_TEXT_URL_RE = re.compile(r'https?://[^\s\'"<>()]+')
+
+# 네이버 관련 게시글 판별용 키워드
+_NAVER_KEYWORD_RE = re.compile(r'네이버|naver|포인트|point|적립', re.IGNORECASE)
+
+# WebDriver 실행 스크립트 (값은 인자로 전달)
+_SET_VALUE_JS = "arguments[0].value = arguments[1];"
+_HIDE_WEBDRIVER_JS = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+# 자연스러운 스크롤 (스크롤 및 대기를 브라우저 내부에서 수행, 최대 약 13초 소요)
+_NATURAL_SCROLL_JS = """
+const [viewportH, scrollable, done] = arguments;
+const rand = (min, max) => min + Math.random() * (max - min);
+const randInt = (min, max) => Math.floor(rand(min, max + 1));
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+async function naturalScroll() {
+    let pos = 0;
+    // 아래로 스크롤
+    const downSteps = randInt(3, 6);
+    for (let i = 0; i < downSteps; i++) {
+        pos = Math.min(scrollable, pos + randInt(Math.floor(viewportH * 0.3), Math.floor(viewportH * 0.8)));
+        window.scrollTo({top: pos, behavior: 'smooth'});
+        await sleep(rand(800, 1600));
+    }
+    // 위로 약간 스크롤 (자연스러운 읽기 패턴)
+    const upSteps = randInt(1, 3);
+    for (let i = 0; i < upSteps; i++) {
+        pos = Math.max(0, pos - randInt(Math.floor(viewportH * 0.1), Math.floor(viewportH * 0.4)));
+        window.scrollTo({top: pos, behavior: 'smooth'});
+        await sleep(rand(600, 1200));
+    }
+}
+naturalScroll().then(() => done(true), () => done(false));
+"""
+
+# 캠페인 도메인별 경로 접두사
+_NPAY_CAMPAIGN_NETLOC = "campaign2.naver.com"
+_CAMPAIGN_RULES = {
+    _NPAY_CAMPAIGN_NETLOC: ("/npay/v2/click-point/",),
+    "ofw.adison.co": ("/u/naverpay/ads/",),
+}
+
+@functools.lru_cache(maxsize=8192)
+def _cached_urlparse(url: str) -> ParseResult:
+    """urlparse 결과 캐시"""
+    return urlparse(url)
+
+# 게시글 수집 시 동시에 처리할 최대 호스트 수
+_MAX_HOST_WORKERS = 8
+
+# 캠페인 캐시 최대 항목 수 (오래된 항목부터 제거)
+_CAMPAIGN_CACHE_MAX = 5000
+
+# 게시글 URL 정규화 시 제거할 추적용 파라미터
+_TRACKING_PARAMS = frozenset({'fbclid', 'gclid'})
+
+def _canonicalize(url: str) -> str:
+    """게시글 URL 정규화 (fragment/추적 파라미터 제거, 쿼리 정렬)"""
+    p = _cached_urlparse(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(p.query, keep_blank_values=True)
+        if not k.startswith('utm_') and k not in _TRACKING_PARAMS
+    )
+    return urlunparse((p.scheme, p.netloc.lower(), p.path.rstrip('/'), '', urlencode(query), ''))
 
 def setup_logging() -> logging.Logger:
     """로깅 시스템 설정"""
@@ -56,8 +143,14 @@ def setup_logging() -> logging.Logger:
         )
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # 큐 핸들러 (파일/콘솔 출력은 백그라운드 리스너 스레드에서 처리)
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
     return logger
 
 def avoid_overlap():
@@ -96,6 +189,8 @@ class NaverCoinScraper:
         self.data_dir = self.work_dir / 'data'
         self.data_dir.mkdir(exist_ok=True) # 폴더가 없으면 생성
         self.visited_urls_file = self.data_dir / 'visited_urls.txt'
+        self._campaign_cache_file = self.data_dir / 'campaigns.json'
+        self._post_etags_file = self.data_dir / 'post_etags.json'
         self.break_point_file = self.data_dir / 'break-point.html'
         # 설정값 (config.py에서 이미 환경변수 처리됨)
         self.gecko_path = config.GECKODRIVER_PATH
@@ -104,12 +199,36 @@ class NaverCoinScraper:
         # User Agent 설정
         self.request_ua = config.REQUEST_USER_AGENT
         self.firefox_ua = config.FIREFOX_USER_AGENT
+        # 계정 정보 (실행 중 1회만 검증)
+        self._accounts = self._get_naver_accounts()
+        # HTTP 세션 (스레드 간 공유, keep-alive 및 커넥션 풀 사용)
+        self.session = self._create_session()
         # 휴면 파일 검사
         self._check_break_point()
         # 방문 기록 로드
         self.visited_urls = self._load_visited_urls()
+        # 게시글별 캠페인 캐시 로드 {정규화된 게시글 URL: [캠페인 URL, ...]}
+        self._campaign_cache = self._load_json_cache(self._campaign_cache_file, "캠페인 캐시")
+        # 게시글별 조건부 요청 검증값 로드 {정규화된 게시글 URL: [ETag, Last-Modified]}
+        self._post_etags = self._load_json_cache(self._post_etags_file, "게시글 검증값")
         self.logger.info(f"초기화 완료 - 방문 기록: {len(self.visited_urls)}개")
     
+    def _create_session(self) -> requests.Session:
+        """커넥션 풀을 사용하는 HTTP 세션 생성"""
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers["User-Agent"] = self.request_ua
+        # 프로그램 종료 시 세션 정리
+        atexit.register(session.close)
+        return session
+    
     def _get_naver_accounts(self) -> Dict[str, str]:
         """네이버 계정 정보 가져오기 (config.py에서 로드)"""
         accounts = {}
@@ -148,13 +267,52 @@ class NaverCoinScraper:
     def _save_visited_urls(self) -> None:
         """방문 기록 저장"""
         try:
-            with open(self.visited_urls_file, 'w', encoding='utf-8') as f:
-                for url in sorted(self.visited_urls):
-                    f.write(f"{url}\n")
+            # 임시 파일에 일괄 기록 후 교체 (중단 시 기존 파일 보존)
+            tmp_file = self.visited_urls_file.with_name(self.visited_urls_file.name + '.tmp')
+            with open(tmp_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                if self.visited_urls:
+                    f.write("\n".join(sorted(self.visited_urls)) + "\n")
+            os.replace(tmp_file, self.visited_urls_file)
             self.logger.info(f"방문 기록 저장 완료: {len(self.visited_urls)}개")
         except Exception as e:
             self.logger.error(f"방문 기록 저장 실패: {e}")
     
+    def _load_json_cache(self, cache_file: Path, label: str) -> dict:
+        """JSON 캐시 파일 로드"""
+        try:
+            if cache_file.exists():
+                with open(cache_file, 'rb') as f:
+                    cache = _json_loads(f.read())
+                if isinstance(cache, dict):
+                    return cache
+        except Exception as e:
+            self.logger.warning(f"{label} 로드 실패: {e}")
+        return {}
+    
+    def _save_json_cache(self, cache_file: Path, cache: dict, label: str) -> None:
+        """JSON 캐시 파일 저장 (임시 파일 기록 후 교체)"""
+        try:
+            tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(cache))
+            os.replace(tmp_file, cache_file)
+            self.logger.info(f"{label} 저장 완료: {len(cache)}개")
+        except Exception as e:
+            self.logger.error(f"{label} 저장 실패: {e}")
+    
+    def _save_campaign_cache(self) -> None:
+        """게시글별 캠페인 캐시 및 검증값 저장"""
+        # 최대 항목 수 초과 시 오래된 항목 제거
+        overflow = len(self._campaign_cache) - _CAMPAIGN_CACHE_MAX
+        for key in list(self._campaign_cache)[:max(0, overflow)]:
+            del self._campaign_cache[key]
+        # 캐시 결과가 없는 검증값은 재사용할 수 없으므로 제거
+        self._post_etags = {
+            key: value for key, value in self._post_etags.items() if key in self._campaign_cache
+        }
+        self._save_json_cache(self._campaign_cache_file, self._campaign_cache, "캠페인 캐시")
+        self._save_json_cache(self._post_etags_file, self._post_etags, "게시글 검증값")
+    
     def _create_break_point(self, reason: str = "보안 감지") -> None:
         """휴면 파일 생성"""
         try:
@@ -204,35 +362,20 @@ class NaverCoinScraper:
     def _perform_natural_scrolling(self, driver: webdriver.Firefox, 
                                  scrollable_height: int, viewport_height: int) -> None:
         """자연스러운 스크롤 패턴 수행"""
-        current_position = 0
-        scroll_steps = random.randint(3, 6)
-        # 아래로 스크롤
-        for i in range(scroll_steps):
-            step_size = random.randint(
-                int(viewport_height * 0.3), 
-                int(viewport_height * 0.8)
-            )
-            current_position = min(scrollable_height, current_position + step_size)
-            driver.execute_script(f"window.scrollTo({{top: {current_position}, behavior: 'smooth'}});")
-            time.sleep(random.uniform(0.8, 1.6))
-        # 위로 약간 스크롤 (자연스러운 읽기 패턴)
-        for _ in range(random.randint(1, 3)):
-            step_size = random.randint(
-                int(viewport_height * 0.1), 
-                int(viewport_height * 0.4)
-            )
-            current_position = max(0, current_position - step_size)
-            driver.execute_script(f"window.scrollTo({{top: {current_position}, behavior: 'smooth'}});")
-            time.sleep(random.uniform(0.6, 1.2))
+        # 스크롤 동작은 브라우저에서 한 번에 실행
+        driver.execute_async_script(_NATURAL_SCROLL_JS, viewport_height, scrollable_height)
+        # 키보드 입력 일정 미리 계산 (PAGE_DOWN 1~3회, 50% 확률로 PAGE_UP 1회)
+        uniform = random.uniform
+        key_schedule = [(Keys.PAGE_DOWN, uniform(0.2, 0.4)) for _ in range(random.randint(1, 3))]
+        if random.random() < 0.5:
+            key_schedule.append((Keys.PAGE_UP, uniform(0.2, 0.4)))
         # 키보드 입력으로 자연스러움 추가
         try:
             body = driver.find_element(By.TAG_NAME, "body")
-            for _ in range(random.randint(1, 3)):
-                body.send_keys(Keys.PAGE_DOWN)
-                time.sleep(random.uniform(0.2, 0.4))
-            if random.choice([True, False]):
-                body.send_keys(Keys.PAGE_UP)
-                time.sleep(random.uniform(0.2, 0.4))
+            send_keys, sleep = body.send_keys, time.sleep
+            for key, delay in key_schedule:
+                send_keys(key)
+                sleep(delay)
         except NoSuchElementException:
             self.logger.debug("body 요소를 찾을 수 없음")
 
@@ -248,11 +391,27 @@ class NaverCoinScraper:
             "[class*='point'] button",
             "button[onclick*='point']"
         ]
-        
-        for selector in selectors:
+        # 후보 버튼 존재 여부를 한 번에 확인 (없으면 바로 체류 단계로)
+        combined_selector = ", ".join(selectors)
+        try:
+            WebDriverWait(driver, 5).until(
+                lambda d: d.find_elements(By.CSS_SELECTOR, combined_selector)
+            )
+            # 선택자 우선순위대로 후보 수집
+            candidates = [
+                (selector, element)
+                for selector in selectors
+                for element in driver.find_elements(By.CSS_SELECTOR, selector)
+            ]
+        except TimeoutException:
+            candidates = []
+        except Exception as e:
+            self.logger.warning(f"포인트 버튼 탐색 실패: {e}")
+            candidates = []
+        for selector, element in candidates:
             try:
-                btn = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                btn = WebDriverWait(driver, 2).until(
+                    EC.element_to_be_clickable(element)
                 )
                 old_url = driver.current_url
                 btn.click()
@@ -283,28 +442,58 @@ class NaverCoinScraper:
         if not campaign_links:
             self.logger.info("방문할 캠페인 링크가 없습니다")
             return
-        accounts = self._get_naver_accounts()
+        accounts = self._accounts
         if not accounts:
             self.logger.error("네이버 계정 정보가 없습니다. config.py 또는 환경변수를 확인하세요")
             return
         self.logger.info(f"Firefox 시작 - 계정 {len(accounts)}개, 링크 {len(campaign_links)}개")
-        for account_id, password in accounts.items():
-            if not account_id or not password:
-                continue
-            driver = None
-            try:
-                driver = self._create_firefox_driver()
-                if self._login_naver(driver, account_id, password):
-                    self._visit_campaign_links(driver, campaign_links, account_id)
-                else:
-                    self.logger.error(f"로그인 실패: {account_id}")
-            except Exception as e:
-                self.logger.error(f"계정 {account_id} 처리 중 오류: {e}")
-            finally:
-                if driver:
-                    self._cleanup_driver(driver)
+        # 브라우저 하나를 모든 계정이 공유 (계정 전환 시 세션 초기화)
+        driver = None
+        try:
+            for account_id, password in accounts.items():
+                if not account_id or not password:
+                    continue
+                if driver is not None:
+                    try:
+                        self._reset_browser_session(driver, campaign_links)
+                    except Exception as e:
+                        # 초기화 실패 시 새 프로필로 같은 계정 진행
+                        self.logger.warning(f"세션 초기화 실패, 드라이버 재생성: {e}")
+                        self._cleanup_driver(driver)
+                        driver = None
+                try:
+                    if driver is None:
+                        driver = self._create_firefox_driver()
+                    if self._login_naver(driver, account_id, password):
+                        self._visit_campaign_links(driver, campaign_links, account_id)
+                    else:
+                        self.logger.error(f"로그인 실패: {account_id}")
+                except Exception as e:
+                    self.logger.error(f"계정 {account_id} 처리 중 오류: {e}")
+                    # 드라이버 상태를 신뢰할 수 없으므로 다음 계정에서 재생성
+                    if driver:
+                        self._cleanup_driver(driver)
+                        driver = None
+        finally:
+            if driver:
+                self._cleanup_driver(driver)
         self.logger.info("모든 링크 방문 완료")
     
+    def _reset_browser_session(self, driver: webdriver.Firefox, campaign_links: Set[str]) -> None:
+        """계정 전환을 위한 쿠키 및 스토리지 초기화"""
+        # 쿠키는 현재 도메인 기준으로만 삭제되므로 방문 대상 도메인별로 처리
+        origins = ['https://nid.naver.com', 'https://www.naver.com']
+        origins.extend(f"https://{netloc}" for netloc in _CAMPAIGN_RULES)
+        for link in campaign_links:
+            parsed = urlparse(link)
+            if parsed.scheme in ('http', 'https') and parsed.netloc:
+                origins.append(f"{parsed.scheme}://{parsed.netloc}")
+        for origin in dict.fromkeys(origins):
+            driver.get(origin + "/")
+            self._handle_alert(driver)
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    
     def _create_firefox_driver(self) -> webdriver.Firefox:
         """Firefox WebDriver 생성"""
         options = webdriver.FirefoxOptions()
@@ -321,9 +510,9 @@ class NaverCoinScraper:
             service = Service(executable_path=self.gecko_path)
             driver = webdriver.Firefox(service=service, options=options)
             # WebDriver 흔적 제거
-            driver.execute_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            )
+            driver.execute_script(_HIDE_WEBDRIVER_JS)
+            # 비동기 스크립트(스크롤) 제한 시간
+            driver.set_script_timeout(30)
             return driver
         except Exception as e:
             self.logger.error(f"Firefox 드라이버 생성 실패: {e}")
@@ -339,10 +528,12 @@ class NaverCoinScraper:
                 EC.presence_of_element_located((By.NAME, "id"))
             )
             # 아이디 입력
-            driver.execute_script(f"document.getElementsByName('id')[0].value='{account_id}'")
+            id_el = driver.find_element(By.NAME, "id")
+            driver.execute_script(_SET_VALUE_JS, id_el, account_id)
             time.sleep(random.uniform(0.5, 1.0))
             # 비밀번호 입력
-            driver.execute_script(f"document.getElementsByName('pw')[0].value='{password}'")
+            pw_el = driver.find_element(By.NAME, "pw")
+            driver.execute_script(_SET_VALUE_JS, pw_el, password)
             time.sleep(random.uniform(1.0, 2.0))
             # 로그인 버튼 클릭
             login_btn = driver.find_element(By.ID, "log.login")
@@ -400,17 +591,13 @@ class NaverCoinScraper:
         try:
             current_url = driver.current_url
             parsed_url = urlparse(current_url)
-            if parsed_url.netloc == "campaign2.naver.com" and "/npay/v2/click-point/" in parsed_url.path:
+            if (parsed_url.netloc == _NPAY_CAMPAIGN_NETLOC and
+                parsed_url.path.startswith(_CAMPAIGN_RULES[_NPAY_CAMPAIGN_NETLOC])):
                 # 네이버 포인트 캠페인
                 return self.click_point_and_dwell(driver)
-            elif parsed_url.netloc == "ofw.adison.co" and "/u/naverpay/ads/" in parsed_url.path:
-                # Adison 광고
-                self.dwell_and_scroll(driver)
-                return True
-            else:
-                # 기타 사이트
-                self.dwell_and_scroll(driver)
-                return True
+            # Adison 광고 및 기타 사이트
+            self.dwell_and_scroll(driver)
+            return True
         except Exception as e:
             self.logger.warning(f"사이트 처리 중 오류: {e}")
             return False
@@ -429,27 +616,71 @@ class NaverCoinScraper:
         if not posts:
             return campaign_links
         self.logger.info(f"캠페인 URL 추출 시작: {len(posts)}개 게시글")
-        for i, post_url in enumerate(posts, 1):
-            if post_url in self.visited_urls:
-                self.logger.debug(f"이미 처리된 게시글 건너뜀: {post_url}")
+        # 호스트별로 게시글 분류 (같은 호스트는 순차 요청)
+        posts_by_host = defaultdict(list)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        # 정규화된 URL 기준 중복 제거 (추적 파라미터만 다른 게시글은 1회만 요청)
+        canonical_posts = {_canonicalize(u): u for u in posts}
+        visited_canonical = {_canonicalize(u) for u in self.visited_urls}
+        cache_hits = 0
+        for canonical_url, post_url in canonical_posts.items():
+            if canonical_url in visited_canonical:
+                if debug_enabled:
+                    self.logger.debug(f"이미 처리된 게시글 건너뜀: {post_url}")
                 continue
+            # 캐시된 게시글은 결과 재사용 (검증값이 있으면 조건부 요청으로 확인)
+            cached = self._campaign_cache.pop(canonical_url, None)
+            if cached is not None:
+                self._campaign_cache[canonical_url] = cached
+                if canonical_url not in self._post_etags:
+                    campaign_links.update(cached)
+                    cache_hits += 1
+                    continue
+            posts_by_host[urlparse(post_url).hostname].append((canonical_url, post_url))
+        if cache_hits:
+            self.logger.info(f"캠페인 캐시 사용: {cache_hits}개 게시글")
+        if posts_by_host:
+            # 호스트 수는 게시글 링크에 따라 달라지므로 동시 실행 수 제한
+            max_workers = min(len(posts_by_host), _MAX_HOST_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._scrap_host_posts, host_posts): host
+                    for host, host_posts in posts_by_host.items()
+                }
+                for future in as_completed(futures):
+                    try:
+                        for canonical_url, (new_campaigns, validators) in future.result().items():
+                            campaign_links.update(new_campaigns)
+                            self._campaign_cache[canonical_url] = new_campaigns
+                            if validators:
+                                self._post_etags[canonical_url] = validators
+                            else:
+                                self._post_etags.pop(canonical_url, None)
+                    except Exception as e:
+                        self.logger.error(f"호스트 처리 중 오류 ({futures[future]}): {e}")
+            self._save_campaign_cache()
+        self.logger.info(f"캠페인 URL 추출 완료: {len(campaign_links)}개")
+        return campaign_links
+    
+    def _scrap_host_posts(self, host_posts: List[Tuple[str, str]]
+                          ) -> Dict[str, Tuple[List[str], List[str]]]:
+        """단일 호스트의 게시글들에서 캠페인 URL 추출 {정규화된 게시글 URL: ([캠페인 URL, ...], 검증값)}"""
+        results = {}
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        for i, (canonical_url, post_url) in enumerate(host_posts, 1):
             try:
-                self.logger.debug(f"게시글 분석 중 ({i}/{len(posts)}): {post_url}")
-                # 게시글 내용 가져오기
-                response = requests.get(
-                    post_url, 
-                    headers={"User-Agent": self.request_ua},
-                    timeout=15
+                if debug_enabled:
+                    self.logger.debug(f"게시글 분석 중 ({i}/{len(host_posts)}): {post_url}")
+                new_campaigns, validators, from_cache = self._fetch_post_campaigns(
+                    canonical_url, post_url
                 )
-                response.raise_for_status()
-                # URL 후보 추출
-                candidates = self._extract_url_candidates(response.text, post_url)
-                # 캠페인 URL 필터링
-                new_campaigns = self._filter_campaign_urls(candidates)
-                campaign_links.update(new_campaigns)
-                if new_campaigns:
+                results[canonical_url] = (new_campaigns, validators)
+                if from_cache:
+                    if debug_enabled:
+                        self.logger.debug(f"캐시된 캠페인 재사용 ({len(new_campaigns)}개): {post_url}")
+                elif new_campaigns:
                     self.logger.info(f"새 캠페인 발견 ({len(new_campaigns)}개): {post_url}")
-                # 요청 간 대기
+                # 같은 호스트 요청 간 대기
                 time.sleep(random.uniform(0.3, 0.8))
             except requests.RequestException as e:
                 self.logger.warning(f"게시글 가져오기 실패 ({post_url}): {e}")
@@ -457,66 +688,133 @@ class NaverCoinScraper:
             except Exception as e:
                 self.logger.error(f"게시글 처리 중 오류 ({post_url}): {e}")
                 continue
-        self.logger.info(f"캠페인 URL 추출 완료: {len(campaign_links)}개")
-        return campaign_links
+        return results
     
-    def _extract_url_candidates(self, html_content: str, base_url: str) -> Set[str]:
-        """HTML에서 URL 후보들 추출"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def _fetch_post_campaigns(self, canonical_url: str,
+                              post_url: str) -> Tuple[List[str], List[str], bool]:
+        """게시글 조건부 요청 후 캠페인 URL, 검증값(ETag, Last-Modified), 캐시 사용 여부 반환"""
+        headers = {}
+        cached = self._campaign_cache.get(canonical_url)
+        stored_validators = self._post_etags.get(canonical_url)
+        if cached is not None and stored_validators:
+            etag, last_modified = stored_validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        try:
+            return self._request_post_campaigns(post_url, headers, cached, stored_validators)
+        except requests.RequestException as e:
+            if cached is None:
+                raise
+            # 요청 실패 시 캐시 결과 재사용
+            self.logger.warning(f"게시글 확인 실패, 캐시 사용 ({post_url}): {e}")
+            return cached, stored_validators, True
+    
+    def _request_post_campaigns(self, post_url: str, headers: Dict[str, str],
+                                cached: List[str], stored_validators: List[str]
+                                ) -> Tuple[List[str], List[str], bool]:
+        """게시글 요청 및 캠페인 URL 추출"""
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        # 게시글 내용 가져오기
+        with self.session.get(post_url, headers=headers, stream=True, timeout=15) as response:
+            # 변경 없음: 캐시 결과 재사용
+            if response.status_code == 304 and cached is not None:
+                if debug_enabled:
+                    self.logger.debug(f"게시글 변경 없음, 캐시 사용: {post_url}")
+                return cached, stored_validators, True
+            response.raise_for_status()
+            validators = [
+                response.headers.get("ETag", ""),
+                response.headers.get("Last-Modified", "")
+            ]
+            if not any(validators):
+                validators = []
+            # HTML이 아닌 응답(이미지, PDF 등)은 본문을 받지 않음
+            content_type = response.headers.get("Content-Type", "").lower()
+            if content_type and not any(t in content_type for t in ("text/html", "application/xhtml")):
+                if debug_enabled:
+                    self.logger.debug(f"HTML이 아닌 게시글 건너뜀 ({content_type}): {post_url}")
+                return [], validators, False
+            # URL 후보 추출 (수신과 동시에 파싱)
+            candidates = self._extract_url_candidates(response.iter_content(8192), post_url)
+        # 캠페인 URL 필터링
+        return sorted(self._filter_campaign_urls(candidates)), validators, False
+    
+    def _extract_url_candidates(self, html_chunks: Iterable[bytes],
+                                base_url: str) -> Set[Tuple[str, ParseResult]]:
+        """HTML 조각을 순차 파싱하며 URL 후보들 추출 (URL, 파싱 결과) 쌍으로 반환"""
         candidates = set()
-        # 1. a 태그의 href, data-href 속성
-        for a_tag in soup.find_all('a'):
-            for attr in ('href', 'data-href'):
-                href = a_tag.get(attr)
-                if href:
-                    candidates.add(href.strip())
-            # 2. onclick 속성에서 URL 추출
-            onclick = a_tag.get('onclick')
-            if onclick:
-                url_matches = re.findall(r"['\"](https?://[^'\"]+)['\"]", onclick)
-                candidates.update(url_matches)
-        # 3. 본문 텍스트에서 URL 추출
-        text_content = soup.get_text(" ", strip=True)
-        text_urls = re.findall(r'https?://[^\s\'"<>()]+', text_content)
-        candidates.update(text_urls)
-        # 4. URL 정규화
+        parser = etree.HTMLPullParser(events=('end',), recover=True)
+        for chunk in html_chunks:
+            if chunk:
+                parser.feed(chunk)
+                self._collect_element_urls(parser.read_events(), candidates)
+        try:
+            parser.close()
+            self._collect_element_urls(parser.read_events(), candidates)
+        except etree.XMLSyntaxError as e:
+            # 문서 종료 처리 실패 시 이미 수집된 후보만 사용
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"HTML 파싱 종료 오류 ({base_url}): {e}")
+        # 수집된 후보 URL 정규화
         normalized_urls = set()
-        base_parsed = urlparse(base_url)
+        base_parsed = _cached_urlparse(base_url)
         base_netloc = f"{base_parsed.scheme}://{base_parsed.netloc}"
         for url in candidates:
             try:
                 # 스킴 없는 URL 처리
                 if url.startswith("//"):
                     url = "https:" + url
-                # 상대 경로 처리
-                elif not urlparse(url).scheme:
-                    url = urljoin(base_netloc + "/", url)
+                    parsed = _cached_urlparse(url)
+                else:
+                    parsed = _cached_urlparse(url)
+                    # 상대 경로 처리
+                    if not parsed.scheme:
+                        url = urljoin(base_netloc + "/", url)
+                        parsed = _cached_urlparse(url)
                 # 유효한 URL인지 확인
-                parsed = urlparse(url)
                 if parsed.scheme in ('http', 'https') and parsed.netloc:
-                    normalized_urls.add(url)
+                    normalized_urls.add((url, parsed))
             except Exception:
                 continue
         return normalized_urls
     
-    def _filter_campaign_urls(self, url_candidates: Set[str]) -> Set[str]:
+    def _collect_element_urls(self, events, candidates: Set[str]) -> None:
+        """파싱 완료된 요소에서 URL 후보 수집 후 요소 메모리 해제"""
+        for _, elem in events:
+            tag = elem.tag
+            # 1. a 태그의 href, data-href 속성
+            if tag == 'a':
+                for attr in ('href', 'data-href'):
+                    href = elem.get(attr)
+                    if href:
+                        candidates.add(href.strip())
+                # 2. onclick 속성에서 URL 추출
+                onclick = elem.get('onclick')
+                if onclick:
+                    candidates.update(_ONCLICK_URL_RE.findall(onclick))
+            # 3. 본문 텍스트에서 URL 추출 (URL이 포함된 텍스트만, script/style 제외)
+            if tag not in ('script', 'style'):
+                texts = [elem.text] + [child.tail for child in elem]
+                for text in texts:
+                    if text and 'http' in text:
+                        candidates.update(_TEXT_URL_RE.findall(text))
+            # tail은 부모 요소 종료 시 처리되므로 유지
+            elem.clear(keep_tail=True)
+    
+    def _filter_campaign_urls(self, url_candidates: Set[Tuple[str, ParseResult]]) -> Set[str]:
         """캠페인 URL 필터링"""
         campaign_urls = set()
-        for url in url_candidates:
+        for url, parsed in url_candidates:
             try:
-                parsed = urlparse(url)
-                # 네이버 포인트 캠페인
-                if (parsed.netloc == "campaign2.naver.com" and 
-                    "/npay/v2/click-point/" in parsed.path):
-                    query_params = parse_qs(parsed.query)
-                    if "eventId" in query_params:
+                # 네이버 포인트 캠페인(eventId 필수) 및 Adison 광고
+                prefixes = _CAMPAIGN_RULES.get(parsed.netloc)
+                if prefixes and parsed.path.startswith(prefixes):
+                    if (parsed.netloc != _NPAY_CAMPAIGN_NETLOC or
+                        "eventId" in parse_qs(parsed.query)):
                         campaign_urls.add(url)
                         continue
-                # Adison 광고
-                if (parsed.netloc == "ofw.adison.co" and 
-                    "/u/naverpay/ads/" in parsed.path):
-                    campaign_urls.add(url)
-                    continue
                 # 기타 네이버 관련 캠페인 (확장 가능)
                 if "naver" in parsed.netloc and any(keyword in parsed.path.lower() 
                     for keyword in ["point", "campaign", "event"]):
@@ -541,24 +839,35 @@ class NaverCoinScraper:
         else:
             # 캠페인 실행
             self.get_coin(campaign_links)
-        # 방문 기록 교체 (새로운 게시글로 덮어쓰기)
-        self.visited_urls = posts
-        self._save_visited_urls()
+        # 방문 기록 교체 (새로운 게시글로 덮어쓰기, 변경 없으면 저장 생략)
+        if posts != self.visited_urls:
+            self.visited_urls = posts
+            self._save_visited_urls()
+        else:
+            self.logger.info("방문 기록 변경 없음, 저장 생략")
         self.logger.info("게시판 스크래핑 완료")
     
     def _collect_posts_from_sites(self) -> Set[str]:
         """여러 사이트에서 게시글 수집"""
         all_posts = set()
-        for site_url, site_config in config.SCRAPING_SITES.items():
-            try:
-                posts = self._collect_posts_from_site(site_url, site_config)
-                all_posts.update(posts)
-                self.logger.info(f"{len(posts)}개 게시글 수집: {site_url}")
-                # 사이트 간 대기
-                time.sleep(random.uniform(1.0, 2.0))
-            except Exception as e:
-                self.logger.error(f"사이트 스크래핑 실패 ({site_url}): {e}")
-                continue
+        if not config.SCRAPING_SITES:
+            self.logger.info("총 0개 게시글 수집 완료")
+            return all_posts
+        # 사이트별 동시 요청 (사이트당 요청 1건이므로 별도 대기 불필요)
+        with ThreadPoolExecutor(max_workers=len(config.SCRAPING_SITES)) as executor:
+            futures = {
+                executor.submit(self._collect_posts_from_site, site_url, site_config): site_url
+                for site_url, site_config in config.SCRAPING_SITES.items()
+            }
+            for future in as_completed(futures):
+                site_url = futures[future]
+                try:
+                    posts = future.result()
+                    all_posts.update(posts)
+                    self.logger.info(f"{len(posts)}개 게시글 수집: {site_url}")
+                except Exception as e:
+                    self.logger.error(f"사이트 스크래핑 실패 ({site_url}): {e}")
+                    continue
         self.logger.info(f"총 {len(all_posts)}개 게시글 수집 완료")
         return all_posts
     
@@ -566,13 +875,9 @@ class NaverCoinScraper:
         """단일 사이트에서 게시글 수집"""
         posts = set()
         try:
-            response = requests.get(
-                site_url, 
-                headers={"User-Agent": self.request_ua},
-                timeout=15
-            )
+            response = self.session.get(site_url, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             hostname = urlparse(site_url).hostname
             # 게시글 링크 추출
             elements = soup.find_all(site_config["tag"], class_=site_config["class"])
@@ -604,9 +909,7 @@ class NaverCoinScraper:
     
     def _is_naver_related_post(self, element) -> bool:
         """네이버 관련 게시글인지 확인"""
-        text_content = element.get_text(strip=True).lower()
-        naver_keywords = ['네이버', 'naver', '포인트', 'point', '적립']
-        return any(keyword in text_content for keyword in naver_keywords)
+        return bool(_NAVER_KEYWORD_RE.search(element.get_text(strip=True)))
 
 def main():
     """메인 실행 함수"""